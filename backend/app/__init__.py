@@ -0,0 +1 @@
+"""Note organizer backend application package."""
@@ -0,0 +1,533 @@
+"""SQLite persistence layer for the note organizer.
+
+All access goes through :func:`get_conn`, which hands out connections from a
+small per-database pool instead of opening a fresh ``sqlite3.connect()`` for
+every call. Connections are configured once at creation time (WAL journal,
+relaxed sync, in-memory temp store) and returned to the pool when the caller
+is done; the pool is drained at interpreter shutdown.
+"""
+
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
+
+_POOL_SIZE = 5
+
+_pools: dict[str, "queue.Queue[sqlite3.Connection]"] = {}
+_pools_lock = threading.Lock()
+
+
+_DB_PATH: str | None = None
+
+
+def _get_db_path() -> str:
+    """Resolve the on-disk database path, honouring NOTES_DB_PATH.
+
+    Resolved once and memoized: this runs on every get_conn(), and the
+    getenv/abspath/makedirs combination costs several syscalls per call.
+    """
+    global _DB_PATH
+    if _DB_PATH is None:
+        env_path = os.getenv("NOTES_DB_PATH")
+        if env_path:
+            db_path = os.path.abspath(env_path)
+        else:
+            app_dir = os.path.dirname(os.path.abspath(__file__))
+            db_path = os.path.join(os.path.dirname(app_dir), "data", "notes.db")
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        _DB_PATH = db_path
+    return _DB_PATH
+
+
+def _new_connection(db_path: str) -> sqlite3.Connection:
+    """Open a connection configured for pooled, multi-threaded use."""
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+
+def _get_pool(db_path: str) -> "queue.Queue[sqlite3.Connection]":
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = queue.Queue(maxsize=_POOL_SIZE)
+            _pools[db_path] = pool
+        return pool
+
+
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    """Yield a pooled connection, returning it to the pool on exit."""
+    db_path = _get_db_path()
+    pool = _get_pool(db_path)
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _new_connection(db_path)
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Group statements into one BEGIN IMMEDIATE ... COMMIT transaction.
+
+    Pooled connections run in autocommit mode (isolation_level=None), so
+    without this every statement of a multi-step write pays its own fsync.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _close_pools() -> None:
+    """Close every pooled connection; registered via atexit."""
+    with _pools_lock:
+        for pool in _pools.values():
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+atexit.register(_close_pools)
+
+# Write-generation counter: every mutation bumps it, and cached read results
+# embed it in their key, so a write implicitly invalidates all cached lists.
+_generation = 0
+
+
+def _bump_generation() -> None:
+    global _generation
+    _generation += 1
+
+
+# Column order of every notes SELECT; rows are fetched as plain tuples and
+# turned into dicts with zip() instead of paying a sqlite3.Row per row.
+_NOTE_COLS = ("id", "title", "content", "category", "created_at", "updated_at")
+_TAG_COLS = ("name", "note_count")
+
+# Hot CRUD statements are kept as module-level constants so the SQL text is
+# byte-identical across calls and sqlite3's internal statement cache hits.
+_SQL_TAGS_FOR_NOTE = (
+    "SELECT t.name FROM tags t"
+    " JOIN note_tags nt ON nt.tag_id = t.id"
+    " WHERE nt.note_id = ? ORDER BY t.name"
+)
+_SQL_DEL_NOTE_TAGS = "DELETE FROM note_tags WHERE note_id = ?"
+_SQL_INS_NOTE_TAG = "INSERT OR IGNORE INTO note_tags (note_id, tag_id) VALUES (?, ?)"
+_SQL_INS_NOTE = "INSERT INTO notes (title, content, category) VALUES (?, ?, ?)"
+_SQL_GET_NOTE = f"SELECT {', '.join(_NOTE_COLS)} FROM notes WHERE id = ?"
+_SQL_DEL_NOTE = "DELETE FROM notes WHERE id = ?"
+_SQL_LIST_TAGS = (
+    "SELECT t.name, COUNT(nt.note_id) AS note_count FROM tags t"
+    " LEFT JOIN note_tags nt ON nt.tag_id = t.id"
+    " GROUP BY t.id ORDER BY t.name"
+)
+
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    category TEXT,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL COLLATE NOCASE UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS note_tags (
+    note_id INTEGER NOT NULL REFERENCES notes(id) ON DELETE CASCADE,
+    tag_id INTEGER NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+    PRIMARY KEY (note_id, tag_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_notes_category ON notes(category);
+CREATE INDEX IF NOT EXISTS idx_notes_updated ON notes(updated_at DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_note_tags_tag ON note_tags(tag_id, note_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title, content, content='notes', content_rowid='id');
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts(rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts(notes_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE OF title, content ON notes BEGIN
+    INSERT INTO notes_fts(notes_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO notes_fts(rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+
+PRAGMA optimize;
+"""
+
+
+_INITIALIZED = False
+_init_lock = threading.Lock()
+
+
+def init_db() -> None:
+    """Create the schema and seed an empty database, at most once per process.
+
+    The guard makes repeat calls (app factory, forked workers importing the
+    routes) a cheap no-op instead of re-parsing the DDL each time. The DDL
+    runs through executescript, which bypasses the connection's
+    prepared-statement cache; one-shot schema statements would otherwise
+    evict the hot CRUD statements that cache exists for.
+    """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    with _init_lock:
+        if _INITIALIZED:
+            return
+        with get_conn() as conn:
+            conn.executescript(_SCHEMA_SQL)
+            empty = conn.execute("SELECT 1 FROM notes LIMIT 1").fetchone() is None
+        if empty:
+            seed_data()
+        _INITIALIZED = True
+
+
+def get_or_create_tag_ids(
+    conn: sqlite3.Connection, names: list[str]
+) -> list[tuple[int, str]]:
+    """Return (id, name) pairs for the given names, creating missing tags.
+
+    Upserts every name in one INSERT OR IGNORE and resolves all ids with a
+    single SELECT, instead of a SELECT/INSERT pair per name. Names are
+    normalized to lowercase, matching the NOCASE collation on tags.name, so
+    "Work" and "work" resolve to one tag. Input order is preserved; blank
+    names and duplicates are dropped.
+    """
+    cleaned = list(
+        dict.fromkeys(name.strip().lower() for name in names if name.strip())
+    )
+    if not cleaned:
+        return []
+    placeholders = ",".join("?" * len(cleaned))
+    conn.execute(
+        f"INSERT OR IGNORE INTO tags (name) VALUES {','.join(['(?)'] * len(cleaned))}",
+        cleaned,
+    )
+    rows = conn.execute(
+        f"SELECT id, name FROM tags WHERE name IN ({placeholders})",
+        cleaned,
+    ).fetchall()
+    # NOCASE matching means the stored name's case can differ from the
+    # cleaned (lowercased) input, so normalize the keys before mapping.
+    id_by_name = {name.lower(): tag_id for tag_id, name in rows}
+    return [(id_by_name[name], name) for name in cleaned]
+
+
+def get_tags_for_note(conn: sqlite3.Connection, note_id: int) -> list[str]:
+    """Return the sorted tag names attached to a note."""
+    cur = conn.execute(_SQL_TAGS_FOR_NOTE, (note_id,))
+    return [name for (name,) in cur]
+
+
+def _tags_for_notes(
+    conn: sqlite3.Connection, note_ids: list[int]
+) -> dict[int, list[str]]:
+    """Return {note_id: sorted tag names} for many notes in one query."""
+    if not note_ids:
+        return {}
+    placeholders = ",".join("?" * len(note_ids))
+    rows = conn.execute(
+        "SELECT nt.note_id, t.name FROM note_tags nt"
+        " JOIN tags t ON t.id = nt.tag_id"
+        f" WHERE nt.note_id IN ({placeholders}) ORDER BY t.name",
+        note_ids,
+    ).fetchall()
+    tags_by_id: dict[int, list[str]] = {}
+    for note_id, name in rows:
+        tags_by_id.setdefault(note_id, []).append(name)
+    return tags_by_id
+
+
+def set_note_tags(conn: sqlite3.Connection, note_id: int, names: list[str]) -> list[str]:
+    """Replace the tag set of a note, returning the applied tag names."""
+    conn.execute(_SQL_DEL_NOTE_TAGS, (note_id,))
+    tags = get_or_create_tag_ids(conn, names)
+    conn.executemany(_SQL_INS_NOTE_TAG, [(note_id, tag_id) for tag_id, _ in tags])
+    _bump_generation()
+    return [name for _, name in tags]
+
+
+def create_note(
+    title: str,
+    content: str = "",
+    category: str | None = None,
+    tags: list[str] | None = None,
+) -> dict[str, Any]:
+    """Insert a note and return it as a dict including its tags."""
+    with get_conn() as conn:
+        with _transaction(conn):
+            cur = conn.execute(_SQL_INS_NOTE, (title, content, category))
+            note_id = cur.lastrowid
+            set_note_tags(conn, note_id, tags or [])
+        _bump_generation()
+        row = conn.execute(_SQL_GET_NOTE, (note_id,)).fetchone()
+        note = dict(zip(_NOTE_COLS, row))
+        note["tags"] = get_tags_for_note(conn, note_id)
+        return note
+
+
+def get_note(note_id: int) -> dict[str, Any] | None:
+    """Fetch a single note with its tags, or None if it does not exist."""
+    with get_conn() as conn:
+        row = conn.execute(_SQL_GET_NOTE, (note_id,)).fetchone()
+        if row is None:
+            return None
+        note = dict(zip(_NOTE_COLS, row))
+        note["tags"] = get_tags_for_note(conn, note_id)
+        return note
+
+
+# Sentinel for update_note's category parameter: category is nullable, so
+# None must mean "clear it" and this object means "leave it unchanged".
+_UNCHANGED: Any = object()
+
+
+def update_note(
+    note_id: int,
+    title: str | None = None,
+    content: str | None = None,
+    category: str | None = _UNCHANGED,
+    tags: list[str] | None = None,
+) -> dict[str, Any] | None:
+    """Apply a partial update to a note; returns the updated note or None.
+
+    Passing category=None explicitly clears the category; omitting it
+    leaves the stored value alone. The UPDATE uses RETURNING, so one
+    statement both detects the missing-id case (no row comes back) and
+    yields the row that previously took a separate existence check plus a
+    select-back.
+    """
+    with get_conn() as conn:
+        with _transaction(conn):
+            sets = ["updated_at = datetime('now')"]
+            params: list[Any] = []
+            if title is not None:
+                sets.append("title = ?")
+                params.append(title)
+            if content is not None:
+                sets.append("content = ?")
+                params.append(content)
+            if category is not _UNCHANGED:
+                sets.append("category = ?")
+                params.append(category)
+            rows = conn.execute(
+                f"UPDATE notes SET {', '.join(sets)} WHERE id = ?"
+                f" RETURNING {', '.join(_NOTE_COLS)}",
+                (*params, note_id),
+            ).fetchall()
+            if not rows:
+                return None
+            if tags is not None:
+                set_note_tags(conn, note_id, tags)
+        _bump_generation()
+        note = dict(zip(_NOTE_COLS, rows[0]))
+        note["tags"] = get_tags_for_note(conn, note_id)
+        return note
+
+
+def delete_note(note_id: int) -> bool:
+    """Delete a note; returns True if a row was removed."""
+    with get_conn() as conn:
+        with _transaction(conn):
+            cur = conn.execute(_SQL_DEL_NOTE, (note_id,))
+            deleted = cur.rowcount > 0
+    if deleted:
+        _bump_generation()
+    return deleted
+
+
+def _fts_match_query(q: str) -> str | None:
+    """Turn a user search string into an FTS5 prefix query.
+
+    Returns None when the string contains anything besides word characters
+    and whitespace (quotes, FTS operators, punctuation), in which case the
+    caller falls back to LIKE matching.
+    """
+    if not q.strip() or re.search(r"[^\w\s]", q):
+        return None
+    return " ".join(f'"{token}"*' for token in q.split())
+
+
+def _build_list_sql(q_mode: str | None, has_tag: bool, has_category: bool) -> str:
+    sql = f"SELECT DISTINCT {', '.join('n.' + col for col in _NOTE_COLS)} FROM notes n"
+    where: list[str] = []
+    if has_tag:
+        sql += (
+            " JOIN note_tags nt ON nt.note_id = n.id"
+            " JOIN tags t ON t.id = nt.tag_id"
+        )
+        where.append("t.name = ?")
+    if q_mode == "fts":
+        where.append("n.id IN (SELECT rowid FROM notes_fts WHERE notes_fts MATCH ?)")
+    elif q_mode == "like":
+        where.append("(n.title LIKE ? OR n.content LIKE ?)")
+    if has_category:
+        where.append("n.category = ?")
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY n.updated_at DESC, n.created_at DESC"
+
+
+# Every filter combination list_notes can produce, built once at import so
+# repeat queries always hand SQLite a previously-seen (and cached) text.
+_LIST_SQL = {
+    (q_mode, has_tag, has_category): _build_list_sql(q_mode, has_tag, has_category)
+    for q_mode in (None, "fts", "like")
+    for has_tag in (False, True)
+    for has_category in (False, True)
+}
+
+
+def list_notes(
+    q: str | None = None,
+    tag: str | None = None,
+    category: str | None = None,
+) -> list[dict[str, Any]]:
+    """List notes with optional text search, tag and category filters.
+
+    Results are cached per (filters, write generation); callers get fresh
+    copies so mutating a returned dict cannot poison the cache.
+    """
+    notes = _list_notes_cached(_generation, q, tag, category)
+    return [{**note, "tags": list(note["tags"])} for note in notes]
+
+
+@lru_cache(maxsize=128)
+def _list_notes_cached(
+    generation: int,
+    q: str | None,
+    tag: str | None,
+    category: str | None,
+) -> list[dict[str, Any]]:
+    q_mode = None
+    params: list[Any] = []
+    if tag:
+        params.append(tag)
+    if q:
+        match = _fts_match_query(q)
+        if match is not None:
+            q_mode = "fts"
+            params.append(match)
+        else:
+            q_mode = "like"
+            like = f"%{q}%"
+            params.extend([like, like])
+    if category:
+        params.append(category)
+    sql = _LIST_SQL[(q_mode, bool(tag), bool(category))]
+    with get_conn() as conn:
+        cur = conn.execute(sql, params)
+        notes = [dict(zip(_NOTE_COLS, row)) for row in cur.fetchall()]
+        ids = [note["id"] for note in notes]
+        tags_by_id = _tags_for_notes(conn, ids)
+        for note in notes:
+            note["tags"] = tags_by_id.get(note["id"], [])
+        return notes
+
+
+def list_all_tags() -> list[dict[str, Any]]:
+    """Return every tag with the number of notes attached to it."""
+    return [dict(tag) for tag in _list_all_tags_cached(_generation)]
+
+
+@lru_cache(maxsize=8)
+def _list_all_tags_cached(generation: int) -> list[dict[str, Any]]:
+    with get_conn() as conn:
+        rows = conn.execute(_SQL_LIST_TAGS).fetchall()
+        return [dict(zip(_TAG_COLS, row)) for row in rows]
+
+
+def seed_data() -> None:
+    """Insert a few sample notes so a fresh install is not empty."""
+    samples = [
+        {
+            "title": "Welcome to Note Organizer",
+            "content": "Create, tag and search your notes from the API.",
+            "category": "getting-started",
+            "tags": ["welcome", "docs"],
+        },
+        {
+            "title": "Shopping list",
+            "content": "Milk, eggs, coffee beans.",
+            "category": "personal",
+            "tags": ["errands"],
+        },
+        {
+            "title": "Project kickoff",
+            "content": "Draft the agenda and invite the team.",
+            "category": "work",
+            "tags": ["meeting", "planning"],
+        },
+    ]
+    with get_conn() as conn:
+        with _transaction(conn):
+            conn.executemany(
+                _SQL_INS_NOTE,
+                [(s["title"], s["content"], s["category"]) for s in samples],
+            )
+            # Ids are contiguous: the rows above were appended inside one
+            # exclusive transaction, so back-derive them from the last rowid.
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            note_ids = range(last_id - len(samples) + 1, last_id + 1)
+            all_names = [name for s in samples for name in s["tags"]]
+            id_by_name = {
+                name: tag_id
+                for tag_id, name in get_or_create_tag_ids(conn, all_names)
+            }
+            conn.executemany(
+                _SQL_INS_NOTE_TAG,
+                [
+                    (note_id, id_by_name[name])
+                    for note_id, s in zip(note_ids, samples)
+                    for name in s["tags"]
+                ],
+            )
+        _bump_generation()
@@ -0,0 +1 @@
+"""HTTP route blueprints for the note organizer API."""
@@ -0,0 +1,110 @@
+"""Note CRUD endpoints."""
+
+import msgspec
+import orjson
+from flask import Response, request
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+
+from ..db import (
+    create_note,
+    delete_note,
+    get_note,
+    list_notes,
+    update_note,
+)
+from ..schemas import (
+    NoteCreate,
+    NoteCreateSchema,
+    NoteQueryArgsSchema,
+    NoteSchema,
+    NoteUpdate,
+    NoteUpdateSchema,
+)
+
+_note_create_decoder = msgspec.json.Decoder(NoteCreate)
+_note_update_decoder = msgspec.json.Decoder(NoteUpdate)
+
+
+def _decode_body(decoder: msgspec.json.Decoder):
+    """Decode and validate the request body, aborting with 422 on bad input."""
+    try:
+        return decoder.decode(request.get_data())
+    except msgspec.DecodeError as exc:
+        abort(422, message=str(exc))
+
+
+blp = Blueprint("notes", __name__, url_prefix="/notes", description="Note operations")
+
+
+@blp.route("")
+class NotesCollection(MethodView):
+    @blp.arguments(NoteQueryArgsSchema, location="query")
+    @blp.doc(
+        responses={
+            200: {
+                "description": "List of notes",
+                "content": {
+                    "application/json": {"schema": NoteSchema(many=True)}
+                },
+            }
+        }
+    )
+    def get(self, args):
+        """List notes, optionally filtered by search text, tag or category."""
+        notes = list_notes(q=args["q"], tag=args["tag"], category=args["category"])
+        return Response(orjson.dumps(notes, default=str), mimetype="application/json")
+
+    @blp.doc(
+        requestBody={
+            "required": True,
+            "content": {"application/json": {"schema": NoteCreateSchema}},
+        }
+    )
+    @blp.response(201, NoteSchema)
+    def post(self):
+        """Create a new note."""
+        data = _decode_body(_note_create_decoder)
+        return create_note(
+            title=data.title,
+            content=data.content,
+            category=data.category,
+            tags=data.tags,
+        )
+
+
+@blp.route("/<int:note_id>")
+class NoteItem(MethodView):
+    @blp.response(200, NoteSchema)
+    def get(self, note_id):
+        """Fetch one note by id."""
+        note = get_note(note_id)
+        if note is None:
+            abort(404, message="Note not found")
+        return note
+
+    @blp.doc(
+        requestBody={
+            "required": True,
+            "content": {"application/json": {"schema": NoteUpdateSchema}},
+        }
+    )
+    @blp.response(200, NoteSchema)
+    def patch(self, note_id):
+        """Partially update a note."""
+        data = _decode_body(_note_update_decoder)
+        fields = {
+            key: value
+            for key, value in msgspec.structs.asdict(data).items()
+            if value is not msgspec.UNSET
+        }
+        note = update_note(note_id, **fields)
+        if note is None:
+            abort(404, message="Note not found")
+        return note
+
+    @blp.response(204)
+    def delete(self, note_id):
+        """Delete a note."""
+        if not delete_note(note_id):
+            abort(404, message="Note not found")
@@ -0,0 +1,17 @@
+"""Tag listing endpoint."""
+
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from ..db import list_all_tags
+from ..schemas import TagSchema
+
+blp = Blueprint("tags", __name__, url_prefix="/tags", description="Tag operations")
+
+
+@blp.route("")
+class TagsCollection(MethodView):
+    @blp.response(200, TagSchema(many=True))
+    def get(self):
+        """List every tag with its note count."""
+        return list_all_tags()
@@ -0,0 +1,75 @@
+"""Schemas describing the note organizer API payloads.
+
+Request bodies are validated with msgspec Structs (C-accelerated decode
+straight from the raw request bytes); the marshmallow schemas remain for
+response serialization and OpenAPI documentation.
+"""
+
+import msgspec
+from marshmallow import Schema, fields
+
+
+class NoteCreate(msgspec.Struct):
+    """Payload accepted when creating a note."""
+
+    title: str
+    content: str = ""
+    category: str | None = None
+    tags: list[str] = []
+
+
+class NoteUpdate(msgspec.Struct):
+    """Partial payload accepted when updating a note.
+
+    UNSET distinguishes "field omitted" from an explicit null/empty value.
+    """
+
+    title: str | msgspec.UnsetType = msgspec.UNSET
+    content: str | msgspec.UnsetType = msgspec.UNSET
+    category: str | None | msgspec.UnsetType = msgspec.UNSET
+    tags: list[str] | msgspec.UnsetType = msgspec.UNSET
+
+
+class NoteSchema(Schema):
+    """Full note representation returned by the API."""
+
+    id = fields.Int(dump_only=True)
+    title = fields.Str(required=True)
+    content = fields.Str(load_default="")
+    category = fields.Str(load_default=None, allow_none=True)
+    tags = fields.List(fields.Str(), load_default=list)
+    created_at = fields.Str(dump_only=True)
+    updated_at = fields.Str(dump_only=True)
+
+
+class NoteCreateSchema(Schema):
+    """Payload accepted when creating a note."""
+
+    title = fields.Str(required=True)
+    content = fields.Str(load_default="")
+    category = fields.Str(load_default=None, allow_none=True)
+    tags = fields.List(fields.Str(), load_default=list)
+
+
+class NoteUpdateSchema(Schema):
+    """Partial payload accepted when updating a note."""
+
+    title = fields.Str()
+    content = fields.Str()
+    category = fields.Str(allow_none=True)
+    tags = fields.List(fields.Str())
+
+
+class NoteQueryArgsSchema(Schema):
+    """Query-string filters for listing notes."""
+
+    q = fields.Str(load_default=None)
+    tag = fields.Str(load_default=None)
+    category = fields.Str(load_default=None)
+
+
+class TagSchema(Schema):
+    """Tag name plus usage count."""
+
+    name = fields.Str()
+    note_count = fields.Int()
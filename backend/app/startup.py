@@ -0,0 +1,23 @@
+"""Application factory for the note organizer backend."""
+
+from flask import Flask
+from flask_smorest import Api
+
+from .db import init_db
+from .routes.notes import blp as notes_blp
+from .routes.tags import blp as tags_blp
+
+
+def setup_app() -> Flask:
+    """Build and configure the Flask application."""
+    app = Flask(__name__)
+    app.config["API_TITLE"] = "Note Organizer API"
+    app.config["API_VERSION"] = "v1"
+    app.config["OPENAPI_VERSION"] = "3.0.3"
+
+    init_db()
+
+    api = Api(app)
+    api.register_blueprint(notes_blp)
+    api.register_blueprint(tags_blp)
+    return app